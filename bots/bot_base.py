@@ -0,0 +1,41 @@
+"""
+Shared state and connections for Trade.re bots
+
+Every bot carries its trader credentials, a keep-alive aiohttp session, a
+market data feed, an order channel and a per-tick log buffer.
+`async with bot.connect():` opens the session and feed the bot was not
+given (runner.py shares one of each), starts the bot's own order channel,
+which is authenticated per trader, and closes whatever it opened on exit.
+"""
+
+import contextlib
+import aiohttp
+from typing import Optional
+from dataclasses import dataclass, field
+from market_feed import MarketFeed
+from order_channel import OrderChannel
+from log_buffer import LogBuffer
+
+
+@dataclass
+class Bot:
+    trader_id: str
+    token: str
+    session: Optional[aiohttp.ClientSession] = None  # Keep-alive pool, may be shared; opened by connect() if not given
+    feed: Optional[MarketFeed] = None  # Streamed market data, may be shared; started by connect() if not given
+    orders: Optional[OrderChannel] = None  # Order WebSocket with REST fallback, started by connect()
+    out: LogBuffer = field(default_factory=LogBuffer)  # Per-tick log lines, flushed once per loop
+
+    @contextlib.asynccontextmanager
+    async def connect(self):
+        """Open the bot's session, feed and order channel for the duration of the block"""
+        async with contextlib.AsyncExitStack() as stack:
+            if self.session is None:
+                connector = aiohttp.TCPConnector(limit=32, keepalive_timeout=75)
+                self.session = await stack.enter_async_context(aiohttp.ClientSession(connector=connector))
+            if self.feed is None:
+                self.feed = MarketFeed(self.session).start()
+                stack.callback(self.feed.stop)
+            self.orders = OrderChannel(self.session, self.token).start()
+            stack.callback(self.orders.stop)
+            yield self
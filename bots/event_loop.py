@@ -0,0 +1,15 @@
+"""
+Event loop selection for Trade.re bots
+
+run_loop(coro) runs the coroutine on uvloop's libuv-backed loop when uvloop
+is installed, and on the default asyncio loop otherwise (uvloop does not
+support Windows).
+"""
+
+import asyncio
+
+try:
+    import uvloop
+    run_loop = uvloop.run
+except ImportError:
+    run_loop = asyncio.run
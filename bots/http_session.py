@@ -0,0 +1,28 @@
+"""
+Synchronous HTTP session for Trade.re bots
+
+One pooled keep-alive requests.Session for the blocking calls bots make
+before their event loop starts (registration). Bots share it, so it must
+not carry per-bot state such as an Authorization header.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    # POST is not retried by default; a repeated registration only leaves an unused random username
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+        raise_on_status=False  # Let raise_for_status() report the last response
+    )
+)
+SESSION = requests.Session()
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+SESSION.headers["Content-Type"] = "application/json"
@@ -0,0 +1,43 @@
+"""
+Buffered console output for Trade.re bots
+
+Bots collect a tick's log lines with `log()` and write them in one call
+with `flush()` at the end of the loop body, instead of a locked, flushed
+print() per line. With several bots in one process this also keeps each
+bot's lines for a tick together. ts() gives the HH:MM:SS stamp used in
+those lines.
+"""
+
+import sys
+import time
+from typing import TextIO, List
+from dataclasses import dataclass, field
+
+_ts_cache = [0, ""]  # [epoch second, formatted time]
+
+
+def ts() -> str:
+    """Current local time as HH:MM:SS, formatted at most once per second"""
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache[0] = now
+        _ts_cache[1] = time.strftime("%H:%M:%S", time.localtime(now))
+    return _ts_cache[1]
+
+
+@dataclass
+class LogBuffer:
+    stream: TextIO = field(default_factory=lambda: sys.stdout)
+    _lines: List[str] = field(default_factory=list)
+
+    def log(self, line: str):
+        """Queue one line for the next flush"""
+        self._lines.append(line)
+
+    def flush(self):
+        """Write all queued lines in a single write"""
+        if self._lines:
+            self._lines.append("")
+            self.stream.write("\n".join(self._lines))
+            self.stream.flush()
+            self._lines.clear()
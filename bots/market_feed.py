@@ -0,0 +1,135 @@
+"""
+Market Data Feed for Trade.re bots
+
+Keeps the latest trade price and top of book in memory from the server's
+WebSocket stream, so bots read cached fields instead of polling the REST
+API on every tick. If the stream goes quiet for longer than `stale_after`
+seconds, the next read refreshes the snapshot over REST. Other message
+types (order updates, trades) can be handed to callbacks via add_handler.
+
+Environment variables:
+    API_URL: Backend API URL (default: http://localhost:8080)
+    WS_URL: Backend WebSocket URL (default: API_URL with ws:// scheme)
+"""
+
+import os
+import time
+import asyncio
+import aiohttp
+import orjson
+import websockets
+from typing import Optional, Callable
+from dataclasses import dataclass, field
+
+API_URL = os.getenv("API_URL", "http://localhost:8080")
+WS_URL = os.getenv("WS_URL", API_URL.replace("http", "ws", 1))
+
+INSTRUMENT = "R.index"
+
+
+@dataclass
+class MarketFeed:
+    session: aiohttp.ClientSession  # Used for the REST fallback
+    stale_after: float = 15.0  # Seconds without a message before falling back to REST
+    max_backoff: float = 30.0  # Cap on reconnect delay
+    last_price: Optional[float] = None
+    top_bid: Optional[float] = None
+    top_ask: Optional[float] = None
+    last_update: float = 0.0  # time.monotonic() of the last snapshot update
+    _task: Optional[asyncio.Task] = None
+    _handlers: dict = field(default_factory=dict)  # message type -> [callback(data)]
+
+    def add_handler(self, msg_type: str, handler: Callable[[dict], None]):
+        """Call handler(data) for every streamed message of msg_type"""
+        self._handlers.setdefault(msg_type, []).append(handler)
+
+    def start(self) -> "MarketFeed":
+        """Start the background WebSocket reader"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        return self
+
+    def stop(self):
+        """Stop the background WebSocket reader"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def is_stale(self) -> bool:
+        """True if no update has been seen within stale_after seconds"""
+        return time.monotonic() - self.last_update > self.stale_after
+
+    async def ensure_fresh(self):
+        """Refresh the snapshot over REST if the stream has gone quiet"""
+        if self.last_price is None or self.is_stale():
+            await self.refresh()
+
+    async def refresh(self):
+        """Fetch last price and top of book over REST"""
+        async with self.session.get(f"{API_URL}/api/v1/market/stats") as resp:
+            resp.raise_for_status()
+            stats = orjson.loads(await resp.read())
+        async with self.session.get(f"{API_URL}/api/v1/market/orderbook") as resp:
+            resp.raise_for_status()
+            book = orjson.loads(await resp.read())
+
+        self.last_price = float(stats.get("last_price", 1000))
+        self._update_book(book)
+
+    async def _run(self):
+        """Read the WebSocket stream, reconnecting with exponential backoff"""
+        backoff = 1.0
+        while True:
+            try:
+                async with websockets.connect(f"{WS_URL}/ws") as ws:
+                    await ws.send(orjson.dumps({
+                        "type": "subscribe",
+                        "data": f"orderbook:{INSTRUMENT}"
+                    }).decode())
+                    backoff = 1.0
+                    async for frame in ws:
+                        self._handle_frame(frame)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[FEED] WebSocket error: {e}, reconnecting in {backoff:.0f}s")
+
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.max_backoff)
+
+    def _handle_frame(self, frame: str):
+        """Apply one frame; the server may batch several messages per frame"""
+        for line in frame.split("\n"):
+            try:
+                msg = orjson.loads(line)
+            except ValueError:
+                continue
+
+            # A bad message or a failing handler is skipped, not allowed to
+            # drop the connection every bot shares
+            try:
+                msg_type = msg.get("type")
+                data = msg.get("data") or {}
+                handlers = self._handlers.get(msg_type, ())
+                if msg_type == "trade" and data.get("instrument", INSTRUMENT) == INSTRUMENT:
+                    self.last_price = float(data["price"])
+                    self.last_update = time.monotonic()
+                elif msg_type == "orderbook":
+                    self._update_book(data)
+            except Exception as e:
+                print(f"[FEED] Skipping malformed message: {e!r}")
+                continue
+
+            for handler in handlers:
+                try:
+                    handler(data)
+                except Exception as e:
+                    print(f"[FEED] {msg_type} handler {getattr(handler, '__qualname__', handler)} failed: {e!r}")
+
+    def _update_book(self, book: dict):
+        """Cache top of book from an orderbook snapshot"""
+        bids = book.get("bids") or []
+        asks = book.get("asks") or []
+        self.top_bid = float(bids[0]["price"]) if bids else None
+        self.top_ask = float(asks[0]["price"]) if asks else None
+        self.last_update = time.monotonic()
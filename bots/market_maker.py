@@ -13,91 +13,127 @@ Environment variables:
 """
 
 import os
-import time
-import json
-import random
-import requests
-from typing import Optional
-from dataclasses import dataclass
+import secrets
+import orjson
+from dataclasses import dataclass, field
+from bot_base import Bot
+from ticker import Ticker
+from http_session import SESSION
+from event_loop import run_loop
 
 API_URL = os.getenv("API_URL", "http://localhost:8080")
 
+# Recently filled/cancelled order ids remembered for submit replies that arrive late
+FINISHED_ORDERS_SIZE = 256
+
+
 @dataclass
-class MarketMaker:
-    trader_id: str
-    token: str
+class MarketMaker(Bot):
     spread: float = 0.5  # Spread percentage
     order_size: float = 5.0  # Size per order
     leverage: int = 5  # Conservative leverage
     num_levels: int = 3  # Number of price levels on each side
+    tick_size: float = 0.01  # Min price move before a resting level is requoted
+    open_orders: dict = field(default_factory=dict)  # (side, level) -> (order_id, price) resting in the book
+    _finished_orders: dict = field(default_factory=dict)  # Own order ids seen filled/cancelled, oldest first
+
+    def __post_init__(self):
+        # Fields shared by every order; copied and completed per order
+        self._order_tpl = {
+            "trader_id": self.trader_id,
+            "instrument": "R.index",
+            "type": "limit",
+            "leverage": self.leverage
+        }
 
-    def get_market_stats(self) -> dict:
-        """Get current market stats"""
-        resp = requests.get(f"{API_URL}/api/v1/market/stats")
-        resp.raise_for_status()
-        return resp.json()
-
-    def get_orderbook(self) -> dict:
-        """Get current orderbook"""
-        resp = requests.get(f"{API_URL}/api/v1/market/orderbook")
-        resp.raise_for_status()
-        return resp.json()
+    def limit_order(self, side: str, price: float, size: float) -> dict:
+        """Build a limit order payload"""
+        order = self._order_tpl.copy()
+        order["side"] = side
+        order["price"] = f"{price:.2f}"
+        order["size"] = f"{size:.2f}"
+        return order
 
-    def place_order(self, side: str, price: float, size: float) -> dict:
+    async def place_order(self, side: str, price: float, size: float) -> dict:
         """Place a limit order"""
-        resp = requests.post(
-            f"{API_URL}/api/v1/orders",
-            json={
-                "trader_id": self.trader_id,
-                "instrument": "R.index",
-                "side": side,
-                "type": "limit",
-                "price": str(price),
-                "size": str(size),
-                "leverage": self.leverage
-            },
-            headers={"Authorization": f"Bearer {self.token}"}
-        )
-        resp.raise_for_status()
-        return resp.json()
-
-    def cancel_all_orders(self):
-        """Cancel all open orders (simplified - just let them expire)"""
-        pass  # In a real implementation, track and cancel orders
-
-    def update_quotes(self):
-        """Update bid/ask quotes around the current price"""
+        return await self.orders.submit(self.limit_order(side, price, size))
+
+    async def cancel_all_orders(self):
+        """Cancel all tracked resting orders"""
+        cancels = [order_id for order_id, _ in self.open_orders.values()]
+        self.open_orders.clear()
+        if cancels:
+            await self.orders.submit_batch([], cancels=cancels)
+
+    def on_order_update(self, order: dict):
+        """Forget tracked orders that were filled or cancelled"""
+        if order.get("status") not in ("filled", "cancelled"):
+            return
+        if order.get("trader_id") != self.trader_id:
+            return
+
+        # Remember the id in case this update beat the submit reply for the order
+        self._finished_orders[order.get("id")] = None
+        if len(self._finished_orders) > FINISHED_ORDERS_SIZE:
+            del self._finished_orders[next(iter(self._finished_orders))]
+
+        for key, (order_id, _) in list(self.open_orders.items()):
+            if order_id == order.get("id"):
+                del self.open_orders[key]
+
+    async def update_quotes(self):
+        """Requote bid/ask levels whose target price moved since they were posted"""
         try:
-            stats = self.get_market_stats()
-            mid_price = float(stats.get("last_price", 1000))
+            await self.feed.ensure_fresh()
+            mid_price = self.feed.last_price
 
             # Calculate spread
             half_spread = mid_price * (self.spread / 100) / 2
 
-            # Post orders at multiple levels
-            for i in range(self.num_levels):
-                level_offset = half_spread * (i + 1)
-
-                # Bid (buy) orders
-                bid_price = round(mid_price - level_offset, 2)
-                try:
-                    self.place_order("buy", bid_price, self.order_size)
-                    print(f"[MM] Posted BID: {self.order_size} @ ${bid_price:.2f}")
-                except Exception as e:
-                    print(f"[MM] Failed to post bid: {e}")
-
-                # Ask (sell) orders
-                ask_price = round(mid_price + level_offset, 2)
-                try:
-                    self.place_order("sell", ask_price, self.order_size)
-                    print(f"[MM] Posted ASK: {self.order_size} @ ${ask_price:.2f}")
-                except Exception as e:
-                    print(f"[MM] Failed to post ask: {e}")
+            # Target price for each level, bid then ask per level
+            targets = {
+                (side, i): round(mid_price + sign * half_spread * (i + 1), 2)
+                for i in range(self.num_levels)
+                for side, sign in (("buy", -1), ("sell", 1))
+            }
+
+            # Levels with no resting order, or whose price moved at least a tick.
+            # Compared in whole ticks: a one-cent float difference is just under 0.01
+            stale = [
+                key for key, price in targets.items()
+                if key not in self.open_orders
+                or round(abs(price - self.open_orders[key][1]) / self.tick_size) >= 1
+            ]
+            if not stale:
+                return
+
+            # Cancel and replace the stale levels in one batch request
+            cancels = [self.open_orders[key][0] for key in stale if key in self.open_orders]
+            orders = [self.limit_order(side, targets[(side, i)], self.order_size) for side, i in stale]
+            results = await self.orders.submit_batch(orders, cancels=cancels)
+
+            # Forget the replaced orders only once the batch went through, so a
+            # failed request leaves them tracked and they are cancelled next tick
+            for key in stale:
+                self.open_orders.pop(key, None)
+
+            for key, result in zip(stale, results):
+                side, _ = key
+                price = targets[key]
+                label = "BID" if side == "buy" else "ASK"
+                if isinstance(result, Exception):
+                    self.out.log(f"[MM] Failed to post {label.lower()}: {result}")
+                    continue
+
+                order = result["order"]
+                if order.get("status") in ("pending", "partial") and order["id"] not in self._finished_orders:
+                    self.open_orders[key] = (order["id"], price)
+                self.out.log(f"[MM] Posted {label}: {self.order_size} @ ${price:.2f}")
 
         except Exception as e:
-            print(f"[MM] Error updating quotes: {e}")
+            self.out.log(f"[MM] Error updating quotes: {e}")
 
-    def run(self, interval: int = 10):
+    async def run(self, interval: int = 10):
         """Run the market maker loop"""
         print(f"[MM] Market Maker starting...")
         print(f"[MM] Spread: {self.spread}%, Size: {self.order_size}, Leverage: {self.leverage}x")
@@ -105,28 +141,55 @@ class MarketMaker:
         print(f"[MM] NOTE: All positions and leverage are PUBLIC")
         print()
 
-        while True:
-            self.update_quotes()
-            time.sleep(interval)
+        async with self.connect():
+            self.feed.add_handler("order", self.on_order_update)
+
+            try:
+                ticker = Ticker()
+                while True:
+                    await self.update_quotes()
+                    self.out.flush()
+                    await ticker.wait(interval)
+            finally:
+                try:
+                    await self.cancel_all_orders()
+                except Exception as e:
+                    print(f"[MM] Failed to cancel open orders: {e}")
 
 
 def register_bot() -> tuple[str, str]:
     """Register a new market maker bot"""
-    username = f"mm_bot_{random.randint(1000, 9999)}"
-    resp = requests.post(
+    username = f"mm_bot_{secrets.token_hex(4)}"
+    resp = SESSION.post(
         f"{API_URL}/api/v1/auth/register",
-        json={
+        data=orjson.dumps({
             "username": username,
             "password": "bot_password",
             "type": "market_maker"
-        }
+        })
     )
     resp.raise_for_status()
-    data = resp.json()
+    data = orjson.loads(resp.content)
     print(f"[MM] Registered as: {username}")
     return data["trader"]["id"], data["token"]
 
 
+# Loop interval the script and runner.py run the market maker with
+LOOP_INTERVAL = 5  # Update every 5 seconds
+
+
+def create_bot(trader_id: str, token: str) -> MarketMaker:
+    """Market maker with the settings the script and runner.py use"""
+    return MarketMaker(
+        trader_id=trader_id,
+        token=token,
+        spread=0.5,      # 0.5% spread
+        order_size=1.0,  # 1 unit per order - thin book for price movement
+        leverage=5,      # Conservative 5x leverage
+        num_levels=2     # Only 2 levels - keeps book thin so trades move price
+    )
+
+
 def main():
     print("=" * 50)
     print("  Trade.re Market Maker Bot")
@@ -138,16 +201,8 @@ def main():
     trader_id, token = register_bot()
 
     # Create and run market maker
-    mm = MarketMaker(
-        trader_id=trader_id,
-        token=token,
-        spread=0.5,      # 0.5% spread
-        order_size=1.0,  # 1 unit per order - thin book for price movement
-        leverage=5,      # Conservative 5x leverage
-        num_levels=2     # Only 2 levels - keeps book thin so trades move price
-    )
-
-    mm.run(interval=5)  # Update every 5 seconds
+    mm = create_bot(trader_id, token)
+    run_loop(mm.run(interval=LOOP_INTERVAL))
 
 
 if __name__ == "__main__":
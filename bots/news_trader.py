@@ -18,16 +18,24 @@ Environment variables:
 
 import os
 import time
-import json
 import random
-import requests
+import secrets
+import orjson
+import ahocorasick
+from bisect import bisect_right
+from itertools import accumulate
 from typing import Optional, List
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from bot_base import Bot
+from ticker import Ticker
+from http_session import SESSION
+from event_loop import run_loop
+from log_buffer import ts
 
 API_URL = os.getenv("API_URL", "http://localhost:8080")
 NEWS_API_KEY = os.getenv("NEWS_API_KEY", "")
 
+
 # Sentiment keywords (simplified)
 BULLISH_KEYWORDS = [
     "surge", "soar", "rally", "gain", "growth", "bullish", "record high",
@@ -41,6 +49,19 @@ BEARISH_KEYWORDS = [
     "negative", "sell", "panic", "warning", "risk", "uncertainty"
 ]
 
+# Both keyword lists merged into one table: +1 bullish, -1 bearish
+KEYWORD_SIGN = {kw: 1 for kw in BULLISH_KEYWORDS} | {kw: -1 for kw in BEARISH_KEYWORDS}
+
+# Aho-Corasick automaton over KEYWORD_SIGN: one pass finds every match.
+# Values are (keyword, sign).
+SENTIMENT_AUTOMATON = ahocorasick.Automaton()
+for _keyword, _sign in KEYWORD_SIGN.items():
+    SENTIMENT_AUTOMATON.add_word(_keyword, (_keyword, _sign))
+SENTIMENT_AUTOMATON.make_automaton()
+
+# Max headlines whose keyword counts are remembered between cycles
+SCORE_CACHE_SIZE = 1024
+
 # Mock news for when no API key is provided
 MOCK_NEWS = [
     {"title": "Markets surge on positive economic data", "sentiment": "bullish"},
@@ -57,61 +78,102 @@ MOCK_NEWS = [
 
 
 @dataclass
-class NewsTrader:
-    trader_id: str
-    token: str
+class NewsTrader(Bot):
     position_size: float = 2.0  # Size per trade
     leverage: int = 25  # Moderate leverage
     sentiment_threshold: float = 0.3  # Min sentiment score to act
+    current_size: float = 0.0  # Local position size, kept up to date from our own fills
+    reconcile_interval: float = 60.0  # Seconds between REST position reconciles
+    _last_reconcile: float = float("-inf")  # time.monotonic() of the last reconcile
+    news_ttl: float = 300.0  # Seconds to reuse fetched headlines before asking NewsAPI again
+    _news_fetched: float = float("-inf")  # time.monotonic() of the last NewsAPI response
+    _news_etag: Optional[str] = None  # Validators from the last NewsAPI response
+    _news_last_modified: Optional[str] = None
+    _news_cached: Optional[List[dict]] = None  # Articles from the last NewsAPI response
+    _headline_scores: dict = field(default_factory=dict)  # headline -> (bullish, bearish) keyword counts
+    _last_news_key: Optional[int] = None  # Hash of the last headline set acted on
+
+    def __post_init__(self):
+        # Fields shared by every order; copied and completed per order
+        self._order_tpl = {
+            "trader_id": self.trader_id,
+            "instrument": "R.index",
+            "type": "market",
+            "price": "0",  # Market order
+            "leverage": self.leverage
+        }
 
-    def get_market_stats(self) -> dict:
-        """Get current market stats"""
-        resp = requests.get(f"{API_URL}/api/v1/market/stats")
-        resp.raise_for_status()
-        return resp.json()
-
-    def get_position(self) -> Optional[dict]:
+    async def get_position(self) -> Optional[dict]:
         """Get current position"""
-        resp = requests.get(f"{API_URL}/api/v1/traders/{self.trader_id}/positions")
-        resp.raise_for_status()
-        positions = resp.json()
+        async with self.session.get(f"{API_URL}/api/v1/traders/{self.trader_id}/positions") as resp:
+            resp.raise_for_status()
+            positions = orjson.loads(await resp.read())
         return positions[0] if positions else None
 
-    def place_order(self, side: str, size: float) -> dict:
+    async def reconcile_position(self):
+        """Resync the local position size with the server"""
+        position = await self.get_position()
+        self.current_size = float(position["size"]) if position else 0.0
+        self._last_reconcile = time.monotonic()
+
+    def on_trade(self, trade: dict):
+        """Track our position from trades; each side carries its new position size"""
+        if trade.get("buyer_id") == self.trader_id:
+            self.current_size = float(trade["buyer_new_position"])
+        elif trade.get("seller_id") == self.trader_id:
+            self.current_size = float(trade["seller_new_position"])
+
+    def on_liquidation(self, liquidation: dict):
+        """A liquidation closes the whole position"""
+        if liquidation.get("trader_id") == self.trader_id:
+            self.current_size = 0.0
+
+    async def place_order(self, side: str, size: float) -> dict:
         """Place a market order"""
-        resp = requests.post(
-            f"{API_URL}/api/v1/orders",
-            json={
-                "trader_id": self.trader_id,
-                "instrument": "R.index",
-                "side": side,
-                "type": "market",
-                "price": "0",  # Market order
-                "size": str(size),
-                "leverage": self.leverage
-            },
-            headers={"Authorization": f"Bearer {self.token}"}
-        )
-        resp.raise_for_status()
-        return resp.json()
-
-    def fetch_news(self) -> List[dict]:
-        """Fetch news headlines"""
+        order = self._order_tpl.copy()
+        order["side"] = side
+        order["size"] = f"{size:.2f}"
+        result = await self.orders.submit(order)
+        for trade in result.get("trades") or []:
+            self.on_trade(trade)
+        return result
+
+    async def fetch_news(self) -> List[dict]:
+        """Fetch news headlines, reusing the cached articles while fresh or if NewsAPI says they are unchanged"""
         if NEWS_API_KEY:
+            if self._news_cached is not None and time.monotonic() - self._news_fetched < self.news_ttl:
+                return self._news_cached
+
+            headers = {}
+            if self._news_cached is not None:
+                if self._news_etag:
+                    headers["If-None-Match"] = self._news_etag
+                if self._news_last_modified:
+                    headers["If-Modified-Since"] = self._news_last_modified
+
             try:
-                resp = requests.get(
+                async with self.session.get(
                     "https://newsapi.org/v2/top-headlines",
                     params={
                         "apiKey": NEWS_API_KEY,
                         "category": "business",
                         "language": "en",
                         "pageSize": 10
-                    }
-                )
-                resp.raise_for_status()
-                return resp.json().get("articles", [])
+                    },
+                    headers=headers
+                ) as resp:
+                    if resp.status == 304:
+                        self._news_fetched = time.monotonic()
+                        return self._news_cached
+                    resp.raise_for_status()
+                    articles = orjson.loads(await resp.read()).get("articles", [])
+                    self._news_fetched = time.monotonic()
+                    self._news_etag = resp.headers.get("ETag")
+                    self._news_last_modified = resp.headers.get("Last-Modified")
+                    self._news_cached = articles
+                    return articles
             except Exception as e:
-                print(f"[NEWS] Error fetching news: {e}")
+                self.out.log(f"[NEWS] Error fetching news: {e}")
                 return []
         else:
             # Use mock news
@@ -125,17 +187,21 @@ class NewsTrader:
         if not headlines:
             return 0.0
 
+        # Only headlines not seen in earlier cycles need scanning
+        distinct = list(dict.fromkeys(headlines))
+        unseen = [h for h in distinct if h not in self._headline_scores]
+        if len(self._headline_scores) + len(unseen) > SCORE_CACHE_SIZE:
+            self._headline_scores.clear()
+            unseen = distinct
+        if unseen:
+            self._headline_scores.update(zip(unseen, self._scan_headlines(unseen)))
+
         bullish_count = 0
         bearish_count = 0
-
         for headline in headlines:
-            headline_lower = headline.lower()
-            for keyword in BULLISH_KEYWORDS:
-                if keyword in headline_lower:
-                    bullish_count += 1
-            for keyword in BEARISH_KEYWORDS:
-                if keyword in headline_lower:
-                    bearish_count += 1
+            bullish, bearish = self._headline_scores[headline]
+            bullish_count += bullish
+            bearish_count += bearish
 
         total = bullish_count + bearish_count
         if total == 0:
@@ -143,57 +209,86 @@ class NewsTrader:
 
         return (bullish_count - bearish_count) / total
 
-    def trade_on_sentiment(self):
+    def _scan_headlines(self, headlines: List[str]) -> List[tuple[int, int]]:
+        """Count (bullish, bearish) keywords per headline"""
+        counts = [[0, 0] for _ in headlines]
+
+        # Scan all headlines in one pass. No keyword contains a newline, so
+        # no match spans two headlines; the match's end offset tells which
+        # headline it belongs to.
+        lowered = [headline.lower() for headline in headlines]
+        starts = list(accumulate((len(h) + 1 for h in lowered[:-1]), initial=0))
+        joined = "\n".join(lowered)
+
+        # A keyword counts once per headline, however often it appears
+        matches = {
+            (bisect_right(starts, end) - 1, match)
+            for end, match in SENTIMENT_AUTOMATON.iter(joined)
+        }
+        for index, (_, sign) in matches:
+            counts[index][0 if sign > 0 else 1] += 1
+
+        return [tuple(c) for c in counts]
+
+    async def trade_on_sentiment(self):
         """Analyze news and trade based on sentiment"""
         try:
             # Fetch and analyze news
-            news = self.fetch_news()
+            news = await self.fetch_news()
             headlines = [
                 article.get("title", article.get("headline", ""))
                 for article in news
             ]
 
             if not headlines:
-                print("[NEWS] No headlines to analyze")
+                self.out.log("[NEWS] No headlines to analyze")
+                return
+
+            # Same headlines as last cycle means no new signal
+            news_key = hash(tuple(sorted(headlines)))
+            if news_key == self._last_news_key:
+                self.out.log("[NEWS] Headlines unchanged, no trade")
                 return
 
             sentiment = self.analyze_sentiment(headlines)
-            print(f"[NEWS] Headlines analyzed: {len(headlines)}")
-            print(f"[NEWS] Sentiment score: {sentiment:.2f}")
+            self._last_news_key = news_key
+            self.out.log(f"[NEWS] Headlines analyzed: {len(headlines)}")
+            self.out.log(f"[NEWS] Sentiment score: {sentiment:.2f}")
 
             # Log headlines
             for h in headlines[:3]:
-                print(f"[NEWS]   - {h[:60]}...")
+                self.out.log(f"[NEWS]   - {h[:60]}...")
 
             # Only trade if sentiment is strong enough
             if abs(sentiment) < self.sentiment_threshold:
-                print(f"[NEWS] Sentiment too weak ({sentiment:.2f}), no trade")
+                self.out.log(f"[NEWS] Sentiment too weak ({sentiment:.2f}), no trade")
                 return
 
-            # Get current position
-            position = self.get_position()
-            current_size = float(position["size"]) if position else 0
+            # Current position from the local cache, reconciled over REST now and then
+            if time.monotonic() - self._last_reconcile >= self.reconcile_interval:
+                await self.reconcile_position()
+            current_size = self.current_size
 
             if sentiment > self.sentiment_threshold:
                 # Bullish - go long or add to long
                 if current_size >= 0:
-                    print(f"[NEWS] BULLISH signal! Going LONG {self.position_size} @ {self.leverage}x")
-                    self.place_order("buy", self.position_size)
+                    self.out.log(f"[NEWS] BULLISH signal! Going LONG {self.position_size} @ {self.leverage}x")
+                    await self.place_order("buy", self.position_size)
                 else:
-                    print(f"[NEWS] BULLISH signal but already SHORT, holding")
+                    self.out.log(f"[NEWS] BULLISH signal but already SHORT, holding")
 
             elif sentiment < -self.sentiment_threshold:
                 # Bearish - go short or add to short
                 if current_size <= 0:
-                    print(f"[NEWS] BEARISH signal! Going SHORT {self.position_size} @ {self.leverage}x")
-                    self.place_order("sell", self.position_size)
+                    self.out.log(f"[NEWS] BEARISH signal! Going SHORT {self.position_size} @ {self.leverage}x")
+                    await self.place_order("sell", self.position_size)
                 else:
-                    print(f"[NEWS] BEARISH signal but already LONG, holding")
+                    self.out.log(f"[NEWS] BEARISH signal but already LONG, holding")
 
         except Exception as e:
-            print(f"[NEWS] Error in trade_on_sentiment: {e}")
+            self.out.log(f"[NEWS] Error in trade_on_sentiment: {e}")
 
-    def run(self, interval: int = 60):
+    async def run(self, interval: int = 60):
         """Run the news trader loop"""
         print(f"[NEWS] News Sentiment Trader starting...")
         print(f"[NEWS] Position size: {self.position_size}, Leverage: {self.leverage}x")
@@ -204,29 +299,50 @@ class NewsTrader:
             print(f"[NEWS] Using mock news (set NEWS_API_KEY for real news)")
         print()
 
-        while True:
-            print(f"\n[NEWS] {datetime.now().strftime('%H:%M:%S')} - Checking news...")
-            self.trade_on_sentiment()
-            time.sleep(interval)
+        async with self.connect():
+            self.feed.add_handler("trade", self.on_trade)
+            self.feed.add_handler("liquidation", self.on_liquidation)
+
+            ticker = Ticker()
+            while True:
+                self.out.log(f"\n[NEWS] {ts()} - Checking news...")
+                await self.trade_on_sentiment()
+                self.out.flush()
+                await ticker.wait(interval)
 
 
 def register_bot() -> tuple[str, str]:
     """Register a new trading bot"""
-    username = f"news_bot_{random.randint(1000, 9999)}"
-    resp = requests.post(
+    username = f"news_bot_{secrets.token_hex(4)}"
+    resp = SESSION.post(
         f"{API_URL}/api/v1/auth/register",
-        json={
+        data=orjson.dumps({
             "username": username,
             "password": "bot_password",
             "type": "bot"
-        }
+        })
     )
     resp.raise_for_status()
-    data = resp.json()
+    data = orjson.loads(resp.content)
     print(f"[NEWS] Registered as: {username}")
     return data["trader"]["id"], data["token"]
 
 
+# Loop interval the script and runner.py run the news trader with
+LOOP_INTERVAL = 10  # Check news every 10 seconds for more activity
+
+
+def create_bot(trader_id: str, token: str) -> NewsTrader:
+    """News trader with the settings the script and runner.py use"""
+    return NewsTrader(
+        trader_id=trader_id,
+        token=token,
+        position_size=3.0,       # 3 units per trade (matches MM order size)
+        leverage=25,             # Moderate 25x leverage
+        sentiment_threshold=0.1  # Lower threshold for more activity
+    )
+
+
 def main():
     print("=" * 50)
     print("  Trade.re News Sentiment Trading Bot")
@@ -238,15 +354,8 @@ def main():
     trader_id, token = register_bot()
 
     # Create and run news trader
-    trader = NewsTrader(
-        trader_id=trader_id,
-        token=token,
-        position_size=3.0,       # 3 units per trade (matches MM order size)
-        leverage=25,             # Moderate 25x leverage
-        sentiment_threshold=0.1  # Lower threshold for more activity
-    )
-
-    trader.run(interval=10)  # Check news every 10 seconds for more activity
+    trader = create_bot(trader_id, token)
+    run_loop(trader.run(interval=LOOP_INTERVAL))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,181 @@
+"""
+Order Channel for Trade.re bots
+
+Submits orders as framed messages on a long-lived WebSocket
+(/api/v1/ws/orders), authenticated once with the Bearer token at connect,
+so each order skips the per-request HTTP handshake and header overhead.
+Replies are matched to requests by correlation id. While the socket is
+down, orders go through the REST API instead. Several cancels and orders
+can also be sent in one POST /api/v1/orders/batch request.
+
+Environment variables:
+    API_URL: Backend API URL (default: http://localhost:8080)
+    WS_URL: Backend WebSocket URL (default: API_URL with ws:// scheme)
+"""
+
+import os
+import asyncio
+import aiohttp
+import orjson
+import websockets
+from typing import Optional, List, Union
+from dataclasses import dataclass, field
+
+API_URL = os.getenv("API_URL", "http://localhost:8080")
+WS_URL = os.getenv("WS_URL", API_URL.replace("http", "ws", 1))
+
+INSTRUMENT = "R.index"
+
+
+class OrderError(Exception):
+    """Order was rejected, or its outcome is unknown"""
+
+
+@dataclass
+class OrderChannel:
+    session: aiohttp.ClientSession  # Used for the REST fallback
+    token: str
+    timeout: float = 5.0  # Seconds to wait for an acknowledgement
+    max_backoff: float = 30.0  # Cap on reconnect delay
+    _ws: Optional[websockets.ClientConnection] = None
+    _pending: dict = field(default_factory=dict)  # correlation id -> asyncio.Future
+    _next_id: int = 0
+    _task: Optional[asyncio.Task] = None
+    _batch_supported: bool = True  # Cleared if the server has no batch endpoint
+    _headers: dict = field(default_factory=dict)  # REST request headers, set in __post_init__
+
+    def __post_init__(self):
+        self._headers = {
+            "Authorization": f"Bearer {self.token}",
+            "Content-Type": "application/json"
+        }
+
+    def start(self) -> "OrderChannel":
+        """Start the background connection and reply reader"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        return self
+
+    def stop(self):
+        """Stop the background connection"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def submit(self, order: dict) -> dict:
+        """Submit an order, returning {"order": ..., "trades": [...]} as the REST API does"""
+        if self._ws is not None:
+            try:
+                return await self._submit_ws(order)
+            except ConnectionError:
+                pass  # Never reached the server, safe to resend over REST
+
+        async with self.session.post(
+            f"{API_URL}/api/v1/orders",
+            data=orjson.dumps(order),
+            headers=self._headers
+        ) as resp:
+            resp.raise_for_status()
+            return orjson.loads(await resp.read())
+
+    async def cancel(self, order_id: str):
+        """Cancel a resting order"""
+        async with self.session.delete(
+            f"{API_URL}/api/v1/orders/{order_id}",
+            params={"instrument": INSTRUMENT},
+            headers=self._headers
+        ) as resp:
+            resp.raise_for_status()
+
+    async def submit_batch(self, orders: List[dict], cancels: List[str] = ()) -> List[Union[dict, Exception]]:
+        """
+        Cancel resting orders by id, then submit new orders, in one request.
+        Cancel failures are ignored (the order is already gone).
+        Returns one result per order, in order: the submit() response or an exception.
+        """
+        if self._batch_supported:
+            async with self.session.post(
+                f"{API_URL}/api/v1/orders/batch",
+                data=orjson.dumps({
+                    "cancels": [{"order_id": order_id, "instrument": INSTRUMENT} for order_id in cancels],
+                    "orders": orders
+                }),
+                headers=self._headers
+            ) as resp:
+                if resp.status in (404, 405):
+                    print("[ORDERS] Batch endpoint unavailable, submitting orders individually")
+                    self._batch_supported = False
+                else:
+                    resp.raise_for_status()
+                    results = orjson.loads(await resp.read())["results"]
+                    return [
+                        OrderError(result["error"]) if "error" in result else result
+                        for result in results
+                    ]
+
+        await asyncio.gather(*(self.cancel(order_id) for order_id in cancels), return_exceptions=True)
+        return await asyncio.gather(*(self.submit(order) for order in orders), return_exceptions=True)
+
+    async def _submit_ws(self, order: dict) -> dict:
+        self._next_id += 1
+        req_id = str(self._next_id)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[req_id] = future
+
+        try:
+            try:
+                await self._ws.send(orjson.dumps({"id": req_id, "order": order}).decode())
+            except (AttributeError, websockets.ConnectionClosed) as e:
+                raise ConnectionError("order channel is down") from e
+
+            try:
+                resp = await asyncio.wait_for(future, self.timeout)
+            except asyncio.TimeoutError:
+                raise OrderError(f"no acknowledgement for order {req_id}")
+        finally:
+            self._pending.pop(req_id, None)
+
+        if "error" in resp:
+            raise OrderError(resp["error"])
+        return resp
+
+    async def _run(self):
+        """Hold the connection open, reconnecting with exponential backoff"""
+        backoff = 1.0
+        while True:
+            try:
+                async with websockets.connect(
+                    f"{WS_URL}/api/v1/ws/orders",
+                    additional_headers={"Authorization": f"Bearer {self.token}"}
+                ) as ws:
+                    self._ws = ws
+                    backoff = 1.0
+                    async for frame in ws:
+                        self._handle_reply(frame)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[ORDERS] WebSocket error: {e}, using REST, reconnecting in {backoff:.0f}s")
+            finally:
+                self._ws = None
+                self._fail_pending()
+
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.max_backoff)
+
+    def _handle_reply(self, frame: str):
+        try:
+            msg = orjson.loads(frame)
+        except ValueError:
+            return
+
+        future = self._pending.get(msg.get("id"))
+        if future is not None and not future.done():
+            future.set_result(msg)
+
+    def _fail_pending(self):
+        """The orders may or may not have executed, so they must not be resent"""
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(OrderError("order channel closed before acknowledgement"))
+        self._pending.clear()
@@ -14,84 +14,100 @@ Environment variables:
 """
 
 import os
-import time
-import random
-import requests
-from dataclasses import dataclass
-from datetime import datetime
+import secrets
+import orjson
+import numpy as np
+from typing import Callable
+from dataclasses import dataclass, field
+from bot_base import Bot
+from ticker import Ticker
+from http_session import SESSION
+from event_loop import run_loop
+from log_buffer import ts
 
 API_URL = os.getenv("API_URL", "http://localhost:8080")
 
 
+# Random draws generated per NumPy call
+RANDOM_BATCH_SIZE = 1024
+
+
 @dataclass
-class RandomTrader:
-    trader_id: str
-    token: str
+class RandomBuffer:
+    """Hands out values one at a time from batches drawn by generate(n)"""
+    generate: Callable[[int], np.ndarray]
+    values: list = field(default_factory=list)
+
+    def next(self):
+        if not self.values:
+            self.values = self.generate(RANDOM_BATCH_SIZE).tolist()
+        return self.values.pop()
+
+
+@dataclass
+class RandomTrader(Bot):
     min_size: float = 1.0
     max_size: float = 5.0
     leverage: int = 10
+    rng: np.random.Generator = field(default_factory=np.random.default_rng)
+
+    def __post_init__(self):
+        # Fields shared by every order; copied and completed per order
+        self._order_tpl = {
+            "trader_id": self.trader_id,
+            "instrument": "R.index",
+            "leverage": self.leverage
+        }
 
-    def get_orderbook(self) -> dict:
-        """Get current orderbook"""
-        resp = requests.get(f"{API_URL}/api/v1/market/orderbook")
-        resp.raise_for_status()
-        return resp.json()
+        # Pre-generated batches for the per-tick size, side coin flip and delay jitter
+        self._sizes = RandomBuffer(lambda n: np.round(self.rng.uniform(self.min_size, self.max_size, n), 2))
+        self._coins = RandomBuffer(self.rng.random)
+        self._jitter = RandomBuffer(lambda n: self.rng.integers(-2, 3, n, endpoint=True))
 
-    def place_order(self, side: str, order_type: str, price: float, size: float) -> dict:
+    async def place_order(self, side: str, order_type: str, price: float, size: float) -> dict:
         """Place an order"""
-        resp = requests.post(
-            f"{API_URL}/api/v1/orders",
-            json={
-                "trader_id": self.trader_id,
-                "instrument": "R.index",
-                "side": side,
-                "type": order_type,
-                "price": str(price),
-                "size": str(size),
-                "leverage": self.leverage
-            },
-            headers={"Authorization": f"Bearer {self.token}"}
-        )
-        resp.raise_for_status()
-        return resp.json()
-
-    def random_trade(self):
+        order = self._order_tpl.copy()
+        order["side"] = side
+        order["type"] = order_type
+        order["price"] = f"{price:.2f}"
+        order["size"] = f"{size:.2f}"
+        return await self.orders.submit(order)
+
+    async def random_trade(self):
         """Execute a random trade"""
         try:
-            orderbook = self.get_orderbook()
-            bids = orderbook.get("bids", [])
-            asks = orderbook.get("asks", [])
+            await self.feed.ensure_fresh()
+            best_bid = self.feed.top_bid
+            best_ask = self.feed.top_ask
 
-            if not bids and not asks:
-                print(f"[RAND] No orders in book, skipping")
+            if best_bid is None and best_ask is None:
+                self.out.log(f"[RAND] No orders in book, skipping")
                 return
 
-            size = round(random.uniform(self.min_size, self.max_size), 2)
+            size = self._sizes.next()
 
             # Randomly choose to buy or sell
-            if random.random() > 0.5 and asks:
+            if self._coins.next() > 0.5 and best_ask is not None:
                 # Buy (take ask)
-                best_ask = float(asks[0]["price"])
-                print(f"[RAND] {datetime.now().strftime('%H:%M:%S')} BUY {size} @ market (~${best_ask:.2f})")
-                result = self.place_order("buy", "market", 0, size)
+                self.out.log(f"[RAND] {ts()} BUY {size} @ market (~${best_ask:.2f})")
+                result = await self.place_order("buy", "market", 0, size)
                 trades = result.get("trades", [])
                 if trades:
-                    print(f"[RAND] Filled {len(trades)} trade(s)")
-            elif bids:
+                    self.out.log(f"[RAND] Filled {len(trades)} trade(s)")
+            elif best_bid is not None:
                 # Sell (take bid)
-                best_bid = float(bids[0]["price"])
-                print(f"[RAND] {datetime.now().strftime('%H:%M:%S')} SELL {size} @ market (~${best_bid:.2f})")
-                result = self.place_order("sell", "market", 0, size)
+                self.out.log(f"[RAND] {ts()} SELL {size} @ market (~${best_bid:.2f})")
+                result = await self.place_order("sell", "market", 0, size)
                 trades = result.get("trades", [])
                 if trades:
-                    print(f"[RAND] Filled {len(trades)} trade(s)")
+                    self.out.log(f"[RAND] Filled {len(trades)} trade(s)")
             else:
-                print(f"[RAND] No matching side available")
+                self.out.log(f"[RAND] No matching side available")
 
         except Exception as e:
-            print(f"[RAND] Error: {e}")
+            self.out.log(f"[RAND] Error: {e}")
 
-    def run(self, interval: int = 5):
+    async def run(self, interval: int = 5):
         """Run the random trader loop"""
         print(f"[RAND] Random Trader starting...")
         print(f"[RAND] Size range: {self.min_size}-{self.max_size}, Leverage: {self.leverage}x")
@@ -99,30 +115,49 @@ class RandomTrader:
         print(f"[RAND] NOTE: All positions and leverage are PUBLIC")
         print()
 
-        while True:
-            self.random_trade()
-            # Random delay between trades
-            delay = interval + random.randint(-2, 3)
-            time.sleep(max(2, delay))
+        async with self.connect():
+            ticker = Ticker()
+            while True:
+                await self.random_trade()
+                self.out.flush()
+                # Random delay between trades
+                delay = interval + self._jitter.next()
+                await ticker.wait(max(2, delay))
 
 
 def register_bot() -> tuple[str, str]:
     """Register a new trading bot"""
-    username = f"rand_bot_{random.randint(1000, 9999)}"
-    resp = requests.post(
+    username = f"rand_bot_{secrets.token_hex(4)}"
+    resp = SESSION.post(
         f"{API_URL}/api/v1/auth/register",
-        json={
+        data=orjson.dumps({
             "username": username,
             "password": "bot_password",
             "type": "bot"
-        }
+        })
     )
     resp.raise_for_status()
-    data = resp.json()
+    data = orjson.loads(resp.content)
     print(f"[RAND] Registered as: {username}")
     return data["trader"]["id"], data["token"]
 
 
+# Loop interval the script and runner.py run the random trader with
+LOOP_INTERVAL = 3  # Trade every 3 seconds for more activity
+
+
+def create_bot(trader_id: str, token: str) -> RandomTrader:
+    """Random trader with the settings the script and runner.py use"""
+    # Larger orders to sweep through thin orderbook and move price
+    return RandomTrader(
+        trader_id=trader_id,
+        token=token,
+        min_size=2.0,   # Bigger min to move through levels
+        max_size=5.0,   # Larger max for bigger price swings
+        leverage=10
+    )
+
+
 def main():
     print("=" * 50)
     print("  Trade.re Random Trading Bot")
@@ -134,16 +169,8 @@ def main():
     trader_id, token = register_bot()
 
     # Create and run random trader
-    # Larger orders to sweep through thin orderbook and move price
-    trader = RandomTrader(
-        trader_id=trader_id,
-        token=token,
-        min_size=2.0,   # Bigger min to move through levels
-        max_size=5.0,   # Larger max for bigger price swings
-        leverage=10
-    )
-
-    trader.run(interval=3)  # Trade every 3 seconds for more activity
+    trader = create_bot(trader_id, token)
+    run_loop(trader.run(interval=LOOP_INTERVAL))
 
 
 if __name__ == "__main__":
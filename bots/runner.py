@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Bot Runner for Trade.re
+
+Runs market maker, random trader and news trader bots in one process on a
+single asyncio event loop. All bots share one aiohttp connection pool and
+one market data WebSocket. Each bot still registers as its own trader, so
+every position stays PUBLIC under its own name.
+
+Requires Python 3.11+ (asyncio.TaskGroup).
+
+Usage:
+    python runner.py [--market-makers N] [--random-traders N] [--news-traders N]
+
+Environment variables:
+    API_URL: Backend API URL (default: http://localhost:8080)
+    WS_URL: Backend WebSocket URL (default: API_URL with ws:// scheme)
+    NEWS_API_KEY: NewsAPI.org API key (optional, uses mock data if not set)
+"""
+
+import asyncio
+import argparse
+import aiohttp
+import market_maker
+import random_trader
+import news_trader
+from event_loop import run_loop
+from market_feed import MarketFeed
+
+
+async def run_bots(market_makers: int, random_traders: int, news_traders: int):
+    """Register the requested bots and run them until interrupted"""
+    # Bots and their loop intervals, built by the same create_bot() as the standalone scripts
+    bots = []
+    for module, count in ((market_maker, market_makers), (random_trader, random_traders), (news_trader, news_traders)):
+        for _ in range(count):
+            trader_id, token = module.register_bot()
+            bots.append((module.create_bot(trader_id, token), module.LOOP_INTERVAL))
+
+    connector = aiohttp.TCPConnector(limit=64, keepalive_timeout=75)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        feed = MarketFeed(session).start()
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for bot, interval in bots:
+                    bot.session = session
+                    bot.feed = feed
+                    tg.create_task(bot.run(interval=interval))
+        finally:
+            feed.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Trade.re bots in one process")
+    parser.add_argument("--market-makers", type=int, default=1)
+    parser.add_argument("--random-traders", type=int, default=1)
+    parser.add_argument("--news-traders", type=int, default=1)
+    args = parser.parse_args()
+
+    print("=" * 50)
+    print("  Trade.re Bot Runner")
+    print(f"  {args.market_makers} market maker(s), {args.random_traders} random trader(s), "
+          f"{args.news_traders} news trader(s)")
+    print("=" * 50)
+    print()
+
+    run_loop(run_bots(args.market_makers, args.random_traders, args.news_traders))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+"""
+Drift-free loop scheduling for Trade.re bots
+
+`await ticker.wait(interval)` sleeps until the next tick on the monotonic
+clock, so time spent doing work comes out of the interval instead of
+adding to it.
+"""
+
+import time
+import asyncio
+from dataclasses import dataclass, field
+
+
+@dataclass
+class Ticker:
+    next_tick: float = field(default_factory=time.monotonic)
+
+    async def wait(self, interval: float):
+        """Sleep until interval seconds after the previous tick"""
+        self.next_tick += interval
+        now = time.monotonic()
+        # Overran by more than a whole interval: restart the schedule rather than busy-catching up
+        if now - self.next_tick > interval:
+            self.next_tick = now + interval
+        await asyncio.sleep(max(0.0, self.next_tick - now))
@@ -140,7 +140,9 @@ func main() {
 	log.Printf("  GET  /api/v1/history/trades")
 	log.Printf("  GET  /api/v1/history/candles")
 	log.Printf("  POST /api/v1/orders")
+	log.Printf("  POST /api/v1/orders/batch")
 	log.Printf("  DELETE /api/v1/orders/{id}")
+	log.Printf("  GET  /api/v1/ws/orders (WebSocket)")
 	log.Printf("")
 
 	if err := http.ListenAndServe(":"+port, r); err != nil {
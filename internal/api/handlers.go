@@ -2,6 +2,9 @@ package api
 
 import (
 	"encoding/json"
+	"errors"
+	"fmt"
+	"log"
 	"net/http"
 	"strconv"
 	"time"
@@ -10,6 +13,7 @@ import (
 	"github.com/google/uuid"
 	"github.com/gorilla/websocket"
 	"github.com/shopspring/decimal"
+	"github.com/thatreguy/trade.re/internal/auth"
 	"github.com/thatreguy/trade.re/internal/domain"
 	"github.com/thatreguy/trade.re/internal/engine"
 	"github.com/thatreguy/trade.re/internal/ws"
@@ -108,8 +112,12 @@ func (s *Server) RegisterRoutes(r chi.Router) {
 		// Orders
 		r.Route("/orders", func(r chi.Router) {
 			r.Post("/", s.handleSubmitOrder)
+			r.Post("/batch", s.handleSubmitOrderBatch)
 			r.Delete("/{orderID}", s.handleCancelOrder)
 		})
+
+		// Order submission over a long-lived WebSocket (Bearer token at connect)
+		r.Get("/ws/orders", s.handleOrderWebSocket)
 	})
 }
 
@@ -276,42 +284,35 @@ func (s *Server) handleGetOpenInterest(w http.ResponseWriter, r *http.Request) {
 	respondJSON(w, http.StatusOK, oi)
 }
 
-// handleSubmitOrder submits a new order
-func (s *Server) handleSubmitOrder(w http.ResponseWriter, r *http.Request) {
-	var req struct {
-		TraderID   string `json:"trader_id"`
-		Instrument string `json:"instrument"`
-		Side       string `json:"side"`
-		Type       string `json:"type"`
-		Price      string `json:"price"`
-		Size       string `json:"size"`
-		Leverage   int    `json:"leverage"`
-	}
-
-	if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
-		respondError(w, http.StatusBadRequest, "invalid request body")
-		return
-	}
+// orderRequest is the wire format for order submission (REST and WebSocket)
+type orderRequest struct {
+	TraderID   string `json:"trader_id"`
+	Instrument string `json:"instrument"`
+	Side       string `json:"side"`
+	Type       string `json:"type"`
+	Price      string `json:"price"`
+	Size       string `json:"size"`
+	Leverage   int    `json:"leverage"`
+}
 
+// toOrder validates the request and builds a domain order
+func (req *orderRequest) toOrder() (*domain.Order, error) {
 	traderID, err := uuid.Parse(req.TraderID)
 	if err != nil {
-		respondError(w, http.StatusBadRequest, "invalid trader_id")
-		return
+		return nil, errors.New("invalid trader_id")
 	}
 
 	price, err := decimal.NewFromString(req.Price)
 	if err != nil && req.Type == "limit" {
-		respondError(w, http.StatusBadRequest, "invalid price")
-		return
+		return nil, errors.New("invalid price")
 	}
 
 	size, err := decimal.NewFromString(req.Size)
 	if err != nil || size.LessThanOrEqual(decimal.Zero) {
-		respondError(w, http.StatusBadRequest, "invalid size")
-		return
+		return nil, errors.New("invalid size")
 	}
 
-	order := &domain.Order{
+	return &domain.Order{
 		TraderID:   traderID,
 		Instrument: req.Instrument,
 		Side:       domain.Side(req.Side),
@@ -319,12 +320,18 @@ func (s *Server) handleSubmitOrder(w http.ResponseWriter, r *http.Request) {
 		Price:      price,
 		Size:       size,
 		Leverage:   req.Leverage,
-	}
+	}, nil
+}
 
+// maxBatchOrders caps the number of orders in one batch request
+const maxBatchOrders = 100
+
+// submitOrder runs an order through the engine and broadcasts its trades.
+// Callers broadcast the updated book once they are done submitting.
+func (s *Server) submitOrder(order *domain.Order) ([]*domain.Trade, error) {
 	trades, err := s.engine.SubmitOrder(order)
 	if err != nil {
-		respondError(w, http.StatusBadRequest, err.Error())
-		return
+		return nil, err
 	}
 
 	// Broadcast trades via WebSocket
@@ -332,12 +339,209 @@ func (s *Server) handleSubmitOrder(w http.ResponseWriter, r *http.Request) {
 		s.hub.BroadcastTrade(trade)
 	}
 
+	return trades, nil
+}
+
+// handleSubmitOrder submits a new order
+func (s *Server) handleSubmitOrder(w http.ResponseWriter, r *http.Request) {
+	var req orderRequest
+	if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
+		respondError(w, http.StatusBadRequest, "invalid request body")
+		return
+	}
+
+	order, err := req.toOrder()
+	if err != nil {
+		respondError(w, http.StatusBadRequest, err.Error())
+		return
+	}
+
+	trades, err := s.submitOrder(order)
+	if err != nil {
+		respondError(w, http.StatusBadRequest, err.Error())
+		return
+	}
+	s.broadcastOrderBook(order.Instrument)
+
 	respondJSON(w, http.StatusCreated, map[string]interface{}{
 		"order":  order,
 		"trades": trades,
 	})
 }
 
+// cancelRequest identifies a resting order to cancel in a batch
+type cancelRequest struct {
+	OrderID    string `json:"order_id"`
+	Instrument string `json:"instrument"`
+}
+
+// handleSubmitOrderBatch cancels and submits several orders in one request,
+// so a quote update is a single cancel+replace round trip. Cancels run
+// first, then orders; each is processed independently and in order. Order
+// results hold either "order" and "trades" (as in POST /orders) or "error";
+// cancel results hold "order_id" and either "status" or "error".
+func (s *Server) handleSubmitOrderBatch(w http.ResponseWriter, r *http.Request) {
+	var req struct {
+		Cancels []cancelRequest `json:"cancels"`
+		Orders  []orderRequest  `json:"orders"`
+	}
+
+	if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
+		respondError(w, http.StatusBadRequest, "invalid request body")
+		return
+	}
+
+	if len(req.Orders) == 0 && len(req.Cancels) == 0 {
+		respondError(w, http.StatusBadRequest, "orders or cancels required")
+		return
+	}
+	if len(req.Orders) > maxBatchOrders || len(req.Cancels) > maxBatchOrders {
+		respondError(w, http.StatusBadRequest, fmt.Sprintf("at most %d orders and %d cancels per batch", maxBatchOrders, maxBatchOrders))
+		return
+	}
+
+	instruments := make(map[string]bool)
+
+	cancels := make([]map[string]string, 0, len(req.Cancels))
+	for _, c := range req.Cancels {
+		orderID, err := uuid.Parse(c.OrderID)
+		if err != nil {
+			cancels = append(cancels, map[string]string{"order_id": c.OrderID, "error": "invalid order ID"})
+			continue
+		}
+		if err := s.engine.CancelOrder(orderID, c.Instrument); err != nil {
+			cancels = append(cancels, map[string]string{"order_id": c.OrderID, "error": err.Error()})
+			continue
+		}
+		instruments[c.Instrument] = true
+		cancels = append(cancels, map[string]string{"order_id": c.OrderID, "status": "cancelled"})
+	}
+
+	results := make([]map[string]interface{}, 0, len(req.Orders))
+	for i := range req.Orders {
+		order, err := req.Orders[i].toOrder()
+		if err == nil {
+			var trades []*domain.Trade
+			if trades, err = s.submitOrder(order); err == nil {
+				instruments[order.Instrument] = true
+				results = append(results, map[string]interface{}{
+					"order":  order,
+					"trades": trades,
+				})
+				continue
+			}
+		}
+		results = append(results, map[string]interface{}{"error": err.Error()})
+	}
+
+	for instrument := range instruments {
+		s.broadcastOrderBook(instrument)
+	}
+
+	respondJSON(w, http.StatusCreated, map[string]interface{}{
+		"results": results,
+		"cancels": cancels,
+	})
+}
+
+// Order WebSocket limits, mirroring the market data hub's client pumps
+const (
+	orderWSWriteWait      = 10 * time.Second
+	orderWSPongWait       = 60 * time.Second
+	orderWSPingPeriod     = (orderWSPongWait * 9) / 10
+	orderWSMaxMessageSize = 64 * 1024
+)
+
+// handleOrderWebSocket accepts orders as framed messages on a long-lived
+// connection, authenticated once with the Bearer token at connect.
+// Requests are {"id": ..., "order": {...}}; each reply echoes the id with
+// either "order" and "trades" (as in POST /orders) or "error".
+func (s *Server) handleOrderWebSocket(w http.ResponseWriter, r *http.Request) {
+	traderID, err := uuid.Parse(auth.ExtractToken(r))
+	if err != nil || s.engine.GetTrader(traderID) == nil {
+		respondError(w, http.StatusUnauthorized, "invalid token")
+		return
+	}
+
+	conn, err := s.upgrader.Upgrade(w, r, nil)
+	if err != nil {
+		return
+	}
+	defer conn.Close()
+
+	conn.SetReadLimit(orderWSMaxMessageSize)
+	conn.SetReadDeadline(time.Now().Add(orderWSPongWait))
+	conn.SetPongHandler(func(string) error {
+		conn.SetReadDeadline(time.Now().Add(orderWSPongWait))
+		return nil
+	})
+
+	// Ping from a separate goroutine; WriteControl is safe alongside the replies below
+	done := make(chan struct{})
+	defer close(done)
+	go func() {
+		ticker := time.NewTicker(orderWSPingPeriod)
+		defer ticker.Stop()
+		for {
+			select {
+			case <-ticker.C:
+				if err := conn.WriteControl(websocket.PingMessage, nil, time.Now().Add(orderWSWriteWait)); err != nil {
+					return
+				}
+			case <-done:
+				return
+			}
+		}
+	}()
+
+	reply := func(v interface{}) error {
+		conn.SetWriteDeadline(time.Now().Add(orderWSWriteWait))
+		return conn.WriteJSON(v)
+	}
+
+	for {
+		_, data, err := conn.ReadMessage()
+		if err != nil {
+			if websocket.IsUnexpectedCloseError(err, websocket.CloseGoingAway, websocket.CloseAbnormalClosure) {
+				log.Printf("Order WebSocket error: %v", err)
+			}
+			return
+		}
+
+		var msg struct {
+			ID    string       `json:"id"`
+			Order orderRequest `json:"order"`
+		}
+		if err := json.Unmarshal(data, &msg); err != nil {
+			if err := reply(map[string]string{"error": "invalid request body"}); err != nil {
+				return
+			}
+			continue
+		}
+
+		// Orders on this connection always belong to the authenticated trader
+		msg.Order.TraderID = traderID.String()
+
+		resp := map[string]interface{}{"id": msg.ID}
+		order, err := msg.Order.toOrder()
+		if err == nil {
+			var trades []*domain.Trade
+			if trades, err = s.submitOrder(order); err == nil {
+				s.broadcastOrderBook(order.Instrument)
+				resp["order"] = order
+				resp["trades"] = trades
+			}
+		}
+		if err != nil {
+			resp["error"] = err.Error()
+		}
+
+		if err := reply(resp); err != nil {
+			return
+		}
+	}
+}
+
 // handleCancelOrder cancels an existing order
 func (s *Server) handleCancelOrder(w http.ResponseWriter, r *http.Request) {
 	orderIDStr := chi.URLParam(r, "orderID")
@@ -357,10 +561,20 @@ func (s *Server) handleCancelOrder(w http.ResponseWriter, r *http.Request) {
 		respondError(w, http.StatusNotFound, err.Error())
 		return
 	}
+	s.broadcastOrderBook(instrument)
 
 	respondJSON(w, http.StatusOK, map[string]string{"status": "cancelled"})
 }
 
+// broadcastOrderBook pushes the current book to "orderbook:<instrument>" subscribers
+func (s *Server) broadcastOrderBook(instrument string) {
+	book, err := s.engine.GetOrderBook(instrument, 20)
+	if err != nil {
+		return
+	}
+	s.hub.BroadcastOrderBook(instrument, book)
+}
+
 // Market convenience routes for R.index
 
 func (s *Server) handleGetMarketOrderBook(w http.ResponseWriter, r *http.Request) {